@@ -1,19 +1,24 @@
 """LangChain integration for Nimble's web search and content retrieval API."""
 
-from importlib import metadata
-
-from langchain_nimble._types import BrowserlessDriver, SearchDepth
-from langchain_nimble.retrievers import NimbleExtractRetriever, NimbleSearchRetriever
-from langchain_nimble.toolkit import NimbleToolkit
-from langchain_nimble.tools.agent_tool import (
-    NimbleAgentGetTool,
-    NimbleAgentListTool,
-    NimbleAgentRunTool,
-)
-from langchain_nimble.tools.crawl_tool import NimbleCrawlTool
-from langchain_nimble.tools.extract_tool import NimbleExtractTool
-from langchain_nimble.tools.map_tool import NimbleMapTool
-from langchain_nimble.tools.search_tool import NimbleSearchTool
+from importlib import import_module, metadata
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langchain_nimble._types import BrowserlessDriver, SearchDepth
+    from langchain_nimble.retrievers import (
+        NimbleExtractRetriever,
+        NimbleSearchRetriever,
+    )
+    from langchain_nimble.toolkit import NimbleToolkit
+    from langchain_nimble.tools.agent_tool import (
+        NimbleAgentGetTool,
+        NimbleAgentListTool,
+        NimbleAgentRunTool,
+    )
+    from langchain_nimble.tools.crawl_tool import NimbleCrawlTool
+    from langchain_nimble.tools.extract_tool import NimbleExtractTool
+    from langchain_nimble.tools.map_tool import NimbleMapTool
+    from langchain_nimble.tools.search_tool import NimbleSearchTool
 
 try:
     __version__ = metadata.version(__package__)
@@ -22,6 +27,39 @@ except metadata.PackageNotFoundError:
     __version__ = ""
 del metadata  # optional, avoids polluting the results of dir(__package__)
 
+# Public names are imported on first access (PEP 562), so importing the
+# package does not load the SDK, pydantic models and every tool up front.
+_LAZY_IMPORTS = {
+    "BrowserlessDriver": "langchain_nimble._types",
+    "NimbleAgentGetTool": "langchain_nimble.tools.agent_tool",
+    "NimbleAgentListTool": "langchain_nimble.tools.agent_tool",
+    "NimbleAgentRunTool": "langchain_nimble.tools.agent_tool",
+    "NimbleCrawlTool": "langchain_nimble.tools.crawl_tool",
+    "NimbleExtractRetriever": "langchain_nimble.retrievers",
+    "NimbleExtractTool": "langchain_nimble.tools.extract_tool",
+    "NimbleMapTool": "langchain_nimble.tools.map_tool",
+    "NimbleSearchRetriever": "langchain_nimble.retrievers",
+    "NimbleSearchTool": "langchain_nimble.tools.search_tool",
+    "NimbleToolkit": "langchain_nimble.toolkit",
+    "SearchDepth": "langchain_nimble._types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
 __all__ = [
     "BrowserlessDriver",
     "NimbleAgentGetTool",
@@ -0,0 +1,133 @@
+"""In-process response caching for Nimble retrievers."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from operator import mul
+from typing import Any, NamedTuple
+
+import orjson
+from langchain_core.documents import Document
+
+
+def _cache_key(request: dict[str, Any]) -> bytes:
+    """Build a stable, fixed-size cache key from SDK call kwargs."""
+    body = orjson.dumps(request, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+def _copy_documents(docs: tuple[Document, ...] | list[Document]) -> list[Document]:
+    """Copy Documents with their own metadata so callers cannot alter entries."""
+    return [doc.model_copy(update={"metadata": dict(doc.metadata)}) for doc in docs]
+
+
+class _ResponseCache:
+    """Thread-safe LRU cache of retrieved Documents with a TTL.
+
+    Entries older than ``ttl`` seconds are treated as misses and evicted on
+    lookup. When full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, tuple[Document, ...]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> list[Document] | None:
+        """Return cached Documents for ``key``, or None on miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, docs = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return _copy_documents(docs)
+
+    def set(self, key: bytes, docs: list[Document]) -> None:
+        """Store Documents for ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), tuple(_copy_documents(docs)))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _SemanticEntry(NamedTuple):
+    namespace: bytes
+    stored_at: float
+    unit_embedding: tuple[float, ...]
+    docs: tuple[Document, ...]
+
+
+def _normalize(embedding: list[float]) -> tuple[float, ...]:
+    """Scale an embedding to unit length so dot products are cosines."""
+    norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+    return tuple(x / norm for x in embedding)
+
+
+class _SemanticCache:
+    """Thread-safe cache of retrieved Documents keyed on query embeddings.
+
+    A lookup hits when a fresh entry in the same namespace has cosine
+    similarity of at least ``threshold`` with the query embedding, so
+    near-duplicate queries share results. Namespaces keep entries for
+    different request parameters (focus, country, locale, ...) apart.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, threshold: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self._entries: list[_SemanticEntry] = []
+        self._lock = threading.Lock()
+
+    def get(self, namespace: bytes, embedding: list[float]) -> list[Document] | None:
+        """Return Documents of the most similar fresh entry, or None."""
+        unit = _normalize(embedding)
+        now = time.monotonic()
+        with self._lock:
+            self._entries = [e for e in self._entries if now - e.stored_at <= self.ttl]
+            best: _SemanticEntry | None = None
+            best_score = self.threshold
+            for entry in self._entries:
+                if entry.namespace != namespace:
+                    continue
+                score = sum(map(mul, unit, entry.unit_embedding))
+                if score >= best_score:
+                    best, best_score = entry, score
+        return _copy_documents(best.docs) if best is not None else None
+
+    def set(
+        self, namespace: bytes, embedding: list[float], docs: list[Document]
+    ) -> None:
+        """Store Documents for a query embedding, evicting the oldest if full."""
+        entry = _SemanticEntry(
+            namespace,
+            time.monotonic(),
+            _normalize(embedding),
+            tuple(_copy_documents(docs)),
+        )
+        with self._lock:
+            self._entries.append(entry)
+            if len(self._entries) > self.maxsize:
+                del self._entries[0]
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,110 @@
+"""Parsing of raw Nimble API response bodies into LangChain Documents.
+
+Kept free of retriever and client state so the per-result loop stays a
+small, fully typed unit.
+"""
+
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import orjson
+from langchain_core.documents.base import Document
+
+try:
+    import ijson  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:
+    ijson = None
+
+# Shared fallback for absent nested objects, so misses do not allocate.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _search_result_to_document(result: dict[str, Any]) -> Document:
+    """Convert a single raw search result to a LangChain Document."""
+    meta = result.get("metadata") or _EMPTY
+    entity_type = meta.get("entity_type", "")
+    if type(entity_type) is str:
+        # Few distinct values repeat across results; share one object each.
+        entity_type = sys.intern(entity_type)
+
+    return Document(
+        page_content=result.get("content") or "",
+        metadata={
+            "title": result.get("title") or "",
+            "description": result.get("description") or "",
+            "url": result.get("url") or "",
+            "position": meta.get("position", -1),
+            "entity_type": entity_type,
+        },
+    )
+
+
+def _should_stream(request: dict[str, Any]) -> bool:
+    """Stream-parse deep searches, whose bodies carry full page content."""
+    return ijson is not None and request.get("search_depth") == "deep"
+
+
+def _parse_search_response(content: bytes, limit: int) -> list[Document]:
+    """Parse a raw search response body into at most ``limit`` Documents."""
+    data = orjson.loads(content)
+    results = data.get("results") or []
+    return list(map(_search_result_to_document, results[:limit]))
+
+
+class _SearchResultStream:
+    """Incremental parser turning streamed search response chunks into Documents.
+
+    Builds each Document as soon as its result object is complete, so the
+    full response body and its decoded JSON are never held in memory at once.
+    Once ``limit`` Documents are built, the rest of the body can be skipped.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._items: list[dict[str, Any]] = ijson.sendable_list()
+        self._parser = ijson.items_coro(self._items, "results.item", use_float=True)
+        self.limit = limit
+        self.documents: list[Document] = []
+
+    @property
+    def done(self) -> bool:
+        """Whether ``limit`` Documents have been parsed."""
+        return len(self.documents) >= self.limit
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse a chunk of the response body, returning whether parsing is done."""
+        self._parser.send(chunk)
+        self._drain()
+        return self.done
+
+    def close(self) -> list[Document]:
+        """Finish parsing and return the Documents."""
+        if not self.done:
+            self._parser.close()
+            self._drain()
+        return self.documents
+
+    def _drain(self) -> None:
+        remaining = self.limit - len(self.documents)
+        self.documents.extend(map(_search_result_to_document, self._items[:remaining]))
+        del self._items[:]
+
+
+def _parse_extract_response(content: bytes) -> list[Document]:
+    """Parse a raw extract response body into a single-item Document list."""
+    data = orjson.loads(content)
+    page = data.get("data") or _EMPTY
+
+    return [
+        Document(
+            page_content=page.get("markdown") or "",
+            metadata={
+                "title": "",
+                "description": "",
+                "url": data.get("url") or "",
+                "position": 0,
+                "entity_type": "",
+            },
+        )
+    ]
@@ -2,28 +2,225 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import contextlib
+import hashlib
+import socket
+import ssl
+import threading
+from collections import OrderedDict
 from collections.abc import Iterator
 from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
 
+import httpx
 from langchain_core.tools import ToolException
 from langchain_core.utils import secret_from_env
 from nimble_python import APIConnectionError as NimbleConnectionError
 from nimble_python import APIStatusError as NimbleStatusError
 from nimble_python import APITimeoutError as NimbleTimeoutError
-from nimble_python import AsyncNimble, Nimble
+from nimble_python import (
+    AsyncNimble,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    Nimble,
+)
 from pydantic import BaseModel, Field, SecretStr, model_validator
 
+# Keep idle connections around long enough to survive gaps between agent steps.
+_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+_DEFAULT_HEADERS = {"X-Client-Source": "langchain-nimble"}
 
-class _NimbleClientMixin(BaseModel):
-    """Mixin providing Nimble API client configuration and initialization.
 
-    This mixin is shared by both retrievers and tools to avoid code duplication
-    for client configuration and initialization logic.
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Return one SSL context for all clients, so CA certs are loaded once."""
+    return httpx.create_ssl_context()
+
+
+class _SyncHttpxClientWrapper(DefaultHttpxClient):
+    """HTTP/2 httpx client that closes its connection pool when collected."""
+
+    def __init__(self) -> None:
+        super().__init__(http2=True, limits=_CONNECTION_LIMITS, verify=_ssl_context())
+
+    def __del__(self) -> None:
+        if self.is_closed:
+            return
+
+        with contextlib.suppress(Exception):
+            self.close()
+
+
+def _close_pool_sockets(transport: object) -> None:
+    """Close the sockets of an httpcore pool without an event loop.
+
+    asyncio exposes connections as ``TransportSocket`` wrappers, which cannot
+    be closed; close the wrapped socket so its transport's own later close
+    becomes a no-op instead of hitting a reused file descriptor.
+    """
+    pool = getattr(transport, "_pool", None)
+    for connection in getattr(pool, "connections", ()):
+        protocol = getattr(connection, "_connection", None)
+        stream = getattr(protocol, "_network_stream", None)
+        sock = stream.get_extra_info("socket") if stream is not None else None
+        sock = getattr(sock, "_sock", sock)
+        if isinstance(sock, socket.socket):
+            sock.close()
+
+
+class _AsyncHttpxClientWrapper(DefaultAsyncHttpxClient):
+    """HTTP/2 async httpx client that closes its connection pool when collected.
+
+    The pool is bound to the event loop that last sent a request. On
+    collection, ``aclose()`` is scheduled on that loop while it is running;
+    otherwise the pooled sockets are closed directly.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(http2=True, limits=_CONNECTION_LIMITS, verify=_ssl_context())
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        self._loop = asyncio.get_running_loop()
+        return await super().send(request, **kwargs)
+
+    def __del__(self) -> None:
+        if self.is_closed:
+            return
+
+        with contextlib.suppress(Exception):
+            loop = self._loop
+            if loop is not None and loop.is_running():
+                loop.call_soon_threadsafe(loop.create_task, self.aclose())
+                return
+            for transport in (self._transport, *self._mounts.values()):
+                _close_pool_sockets(transport)
+
+
+def _bound_to_other_loop(client: AsyncNimble) -> bool:
+    """Check whether an async client's pool belongs to a non-running loop."""
+    loop = getattr(client._client, "_loop", None)
+    if loop is None:
+        return False
+    try:
+        return loop is not asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+
+def _client_kwargs(
+    api_key: str,
+    base_url: str | None,
+    max_retries: int,
+    timeout: float | None = None,
+) -> dict[str, object]:
+    """Build shared keyword arguments for SDK client construction."""
+    client_kwargs: dict[str, object] = {
+        "api_key": api_key,
+        "max_retries": max_retries,
+        "default_headers": _DEFAULT_HEADERS,
+    }
+    if base_url is not None:
+        client_kwargs["base_url"] = base_url
+    if timeout is not None:
+        client_kwargs["timeout"] = timeout
+    return client_kwargs
+
+
+# Shared sync SDK clients keyed on (api key digest, base URL), least recently
+# used first. Evicted clients stay usable by the instances that hold them and
+# close their pool once the last of those is collected.
+_MAX_SYNC_CLIENTS = 32
+_SYNC_CLIENTS: OrderedDict[tuple[str, str | None], Nimble] = OrderedDict()
+_SYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def _api_key_digest(api_key: str) -> str:
+    """Hash an API key so the raw secret is not held as a registry key."""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+
+def create_sync_client(
+    api_key: str,
+    base_url: str | None,
+    max_retries: int,
+    timeout: float | None = None,
+) -> Nimble:
+    """Return a shared sync SDK client for the given configuration.
+
+    Every tool and retriever with the same API key and base URL reuses one
+    connection pool instead of paying a TCP/TLS handshake per instance. A
+    different ``max_retries`` or ``timeout`` gets a lightweight copy over the
+    same pool. Only the most recently used configurations are kept shared, so
+    rotating API keys or base URLs does not pin one pool each for the life of
+    the process.
     """
+    key = (_api_key_digest(api_key), base_url)
+    with _SYNC_CLIENTS_LOCK:
+        client = _SYNC_CLIENTS.get(key)
+        if client is None:
+            client = Nimble(
+                **_client_kwargs(api_key, base_url, max_retries),  # type: ignore[arg-type]
+                http_client=_SyncHttpxClientWrapper(),
+            )
+            _SYNC_CLIENTS[key] = client
+            if len(_SYNC_CLIENTS) > _MAX_SYNC_CLIENTS:
+                _SYNC_CLIENTS.popitem(last=False)
+        else:
+            _SYNC_CLIENTS.move_to_end(key)
+    overrides: dict[str, Any] = {}
+    if client.max_retries != max_retries:
+        overrides["max_retries"] = max_retries
+    if timeout is not None:
+        overrides["timeout"] = timeout
+    return client.with_options(**overrides) if overrides else client
+
+
+@atexit.register
+def _close_sync_clients() -> None:
+    """Close the shared sync clients' connection pools at interpreter exit."""
+    with _SYNC_CLIENTS_LOCK:
+        clients = list(_SYNC_CLIENTS.values())
+        _SYNC_CLIENTS.clear()
+    for client in clients:
+        with contextlib.suppress(Exception):
+            client.close()
+
+
+def create_async_client(
+    api_key: str,
+    base_url: str | None,
+    max_retries: int,
+    timeout: float | None = None,
+) -> AsyncNimble:
+    """Create an async SDK client for the given configuration.
+
+    Not cached: httpx async connection pools are bound to the event loop that
+    first uses them, so sharing one across instances is unsafe.
+    """
+    return AsyncNimble(
+        **_client_kwargs(api_key, base_url, max_retries, timeout),  # type: ignore[arg-type]
+        http_client=_AsyncHttpxClientWrapper(),
+    )
+
+
+class _NimbleClientConfig(BaseModel):
+    """Nimble API connection settings shared by the toolkit, tools and retrievers."""
 
     nimble_api_key: SecretStr = Field(
         alias="api_key",
         default_factory=secret_from_env("NIMBLE_API_KEY", default=""),
+        description="API key for Nimbleway (or set NIMBLE_API_KEY env var).",
     )
     nimble_api_url: str | None = Field(
         alias="base_url",
@@ -34,15 +231,35 @@ class _NimbleClientMixin(BaseModel):
         default=2,
         ge=0,
         le=5,
-        description="Maximum retry attempts for 5xx errors (0 disables retries)",
+        description=(
+            "Maximum retry attempts for retryable errors (408, 409, 429, 5xx "
+            "and connection errors, as decided by the SDK; 0 disables)"
+        ),
     )
+    request_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Timeout in seconds for each request attempt, so a hung attempt "
+            "is retried instead of consuming the whole budget "
+            "(default: SDK default)."
+        ),
+    )
+
+
+class _NimbleClientMixin(_NimbleClientConfig):
+    """Mixin providing Nimble API client configuration and initialization.
+
+    This mixin is shared by both retrievers and tools to avoid code duplication
+    for client configuration and initialization logic.
+    """
 
     locale: str = "en"
     country: str = "US"
     output_format: str = "markdown"
 
     _sync_client: Nimble | None = None
-    _async_client: AsyncNimble | None = None
+    _async_client_instance: AsyncNimble | None = None
 
     @model_validator(mode="after")
     def initialize_clients(self) -> _NimbleClientMixin:
@@ -52,18 +269,30 @@ class _NimbleClientMixin(BaseModel):
             msg = "API key required. Set NIMBLE_API_KEY or pass api_key parameter."
             raise ValueError(msg)
 
-        client_kwargs: dict[str, object] = {
-            "api_key": api_key,
-            "max_retries": self.max_retries,
-            "default_headers": {"X-Client-Source": "langchain-nimble"},
-        }
-        if self.nimble_api_url is not None:
-            client_kwargs["base_url"] = self.nimble_api_url
-
-        self._sync_client = Nimble(**client_kwargs)  # type: ignore[arg-type]
-        self._async_client = AsyncNimble(**client_kwargs)  # type: ignore[arg-type]
+        self._sync_client = create_sync_client(
+            api_key, self.nimble_api_url, self.max_retries, self.request_timeout
+        )
         return self
 
+    @property
+    def _async_client(self) -> AsyncNimble | None:
+        """Async SDK client bound to the running event loop, created on first use.
+
+        httpx async pools cannot be used from a loop other than the one they
+        first ran on, so a client bound to a different loop (e.g. from an
+        earlier ``asyncio.run``) is replaced.
+        """
+        client = self._async_client_instance
+        if client is None or _bound_to_other_loop(client):
+            client = create_async_client(
+                self.nimble_api_key.get_secret_value(),
+                self.nimble_api_url,
+                self.max_retries,
+                self.request_timeout,
+            )
+            self._async_client_instance = client
+        return client
+
 
 @contextmanager
 def handle_api_errors(operation: str = "API request") -> Iterator[None]:
@@ -89,3 +318,10 @@ def handle_api_errors(operation: str = "API request") -> Iterator[None]:
     except NimbleConnectionError as e:
         msg = f"Nimble API {operation} failed with network error: {e.message}"
         raise ToolException(msg) from e
+    # Raised when a streamed body fails after the SDK handed it over.
+    except httpx.TimeoutException as e:
+        msg = f"Nimble API {operation} timed out: {e}"
+        raise ToolException(msg) from e
+    except httpx.TransportError as e:
+        msg = f"Nimble API {operation} failed with network error: {e}"
+        raise ToolException(msg) from e
@@ -1,75 +1,351 @@
 """Nimble Search API retriever implementations."""
 
-from typing import Any
+import asyncio
+import time
+from abc import abstractmethod
+from collections.abc import Mapping
+from typing import Any, ClassVar
 
+import httpx
 from langchain_core.callbacks.manager import (
     AsyncCallbackManagerForRetrieverRun,
     CallbackManagerForRetrieverRun,
 )
 from langchain_core.documents.base import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
-from nimble_python.types import ExtractResponse, SearchResponse
-from nimble_python.types.search_response import (
-    Result,
-    ResultMetadataSerpMetadata,
+from langchain_core.tools import ToolException
+from pydantic import Field, PrivateAttr, model_validator
+from typing_extensions import Self
+
+from ._cache import _cache_key, _copy_documents, _ResponseCache, _SemanticCache
+from ._parsing import (
+    _parse_extract_response,
+    _parse_search_response,
+    _SearchResultStream,
+    _should_stream,
 )
-from pydantic import Field
-
 from ._types import BrowserlessDriver
 from ._utilities import _NimbleClientMixin, handle_api_errors
 
+_OPTIONAL_SEARCH_FIELDS = (
+    "include_domains",
+    "exclude_domains",
+    "time_range",
+    "start_date",
+    "end_date",
+)
+# Per-call search overrides mapped to SDK kwargs; later names take precedence.
+_SEARCH_OVERRIDES = {
+    "k": "max_results",
+    "max_results": "max_results",
+    "locale": "locale",
+    "country": "country",
+    "output_format": "output_format",
+    "focus": "focus",
+    "search_depth": "search_depth",
+}
+# Per-call extract overrides copied verbatim into SDK kwargs.
+_EXTRACT_OVERRIDES = ("locale", "country")
+# Upper bound on unconsumed background requests started by ``aprefetch``.
+_MAX_PREFETCHED = 8
+
+
+def _retrieve_exception(task: asyncio.Future[list[Document]]) -> None:
+    """Mark a background task's exception as retrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _apply_search_overrides(
+    base: dict[str, Any], overrides: dict[str, Any]
+) -> dict[str, Any]:
+    """Merge per-call overrides into a copy of the default search kwargs."""
+    search_kwargs = dict(base)
+    for name, key in _SEARCH_OVERRIDES.items():
+        if name in overrides:
+            search_kwargs[key] = overrides[name]
+
+    if "include_answer" in overrides:
+        if overrides["include_answer"]:
+            search_kwargs["include_answer"] = overrides["include_answer"]
+        else:
+            search_kwargs.pop("include_answer", None)
+    return search_kwargs
+
+
+def _apply_extract_overrides(
+    base: dict[str, Any], overrides: dict[str, Any]
+) -> dict[str, Any]:
+    """Merge per-call overrides into a copy of the default extract kwargs."""
+    extract_kwargs = dict(base)
+    for name in _EXTRACT_OVERRIDES:
+        if name in overrides:
+            extract_kwargs[name] = overrides[name]
+
+    if "driver" in overrides:
+        if overrides["driver"] is not None:
+            extract_kwargs["driver"] = overrides["driver"]
+        else:
+            extract_kwargs.pop("driver", None)
+
+    if "wait" in overrides:
+        if overrides["wait"] is not None:
+            extract_kwargs["render"] = True
+            extract_kwargs["browser_actions"] = [{"wait": f"{overrides['wait']}ms"}]
+        else:
+            extract_kwargs.pop("render", None)
+            extract_kwargs.pop("browser_actions", None)
+    return extract_kwargs
+
+
+def _check_query(query: str) -> None:
+    """Reject blank queries locally instead of spending an API round trip."""
+    if not query or query.isspace():
+        msg = "Query must be a non-empty string."
+        raise ToolException(msg)
+
+
+def _semantic_namespace(request: dict[str, Any]) -> bytes:
+    """Key semantic cache entries on every search parameter except the query."""
+    return _cache_key({k: v for k, v in request.items() if k != "query"})
+
+
+class _NimbleBaseRetriever(_NimbleClientMixin, BaseRetriever):
+    """Base class for Nimble retrievers.
+
+    Precomputes the query-independent part of the SDK call kwargs once, so
+    the common ``invoke(query)`` path only merges in the query, coalesces
+    concurrent identical async requests, can prefetch requests in the
+    background, and optionally caches responses in memory.
+
+    Pass ``cache_disabled=True`` to ``invoke``/``ainvoke`` to bypass the
+    cache for a single call.
+    """
 
-def _search_result_to_document(result: Result) -> Document:
-    """Convert a single SDK search result to a LangChain Document."""
-    meta = result.metadata
-    position = -1
-    entity_type = ""
-    if isinstance(meta, ResultMetadataSerpMetadata):
-        position = meta.position
-        entity_type = meta.entity_type
-
-    return Document(
-        page_content=result.content or "",
-        metadata={
-            "title": result.title or "",
-            "description": result.description or "",
-            "url": result.url or "",
-            "position": position,
-            "entity_type": entity_type,
-        },
+    cache_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Maximum number of responses to cache in memory, keyed on the "
+            "request (0 disables caching)."
+        ),
+    )
+    cache_ttl: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds a cached response is served before refetching.",
     )
 
+    # Fields whose assignment rebuilds the caches (dropping their entries).
+    _CACHE_FIELDS: ClassVar[frozenset[str]] = frozenset({"cache_size", "cache_ttl"})
+
+    _base_kwargs: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _cache: _ResponseCache | None = None
+    _inflight: dict[tuple[bytes, bool], asyncio.Future[list[Document]]] = PrivateAttr(
+        default_factory=dict
+    )
+    _prefetched: dict[bytes, tuple[float, asyncio.Future[list[Document]]]] = (
+        PrivateAttr(default_factory=dict)
+    )
 
-def _parse_search_response(
-    response: SearchResponse,
-) -> list[Document]:
-    """Parse SDK SearchResponse into LangChain Documents."""
-    return [_search_result_to_document(r) for r in (response.results or [])]
-
-
-def _parse_extract_response(
-    response: ExtractResponse,
-) -> list[Document]:
-    """Parse SDK ExtractResponse into a single-item Document list."""
-    content = ""
-    if response.data and response.data.markdown:
-        content = response.data.markdown
-
-    return [
-        Document(
-            page_content=content,
-            metadata={
-                "title": "",
-                "description": "",
-                "url": response.url or "",
-                "position": 0,
-                "entity_type": "",
-            },
+    @model_validator(mode="after")
+    def precompute_base_kwargs(self) -> Self:
+        """Build the default SDK call kwargs from the configured fields."""
+        self._base_kwargs = self._build_base_kwargs()
+        return self
+
+    @model_validator(mode="after")
+    def initialize_cache(self) -> Self:
+        """Create the caches configured by the cache fields."""
+        self._initialize_caches()
+        return self
+
+    def _initialize_caches(self) -> None:
+        """Create the response cache when caching is enabled."""
+        self._cache = (
+            _ResponseCache(maxsize=self.cache_size, ttl=self.cache_ttl)
+            if self.cache_size > 0
+            else None
         )
-    ]
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._base_kwargs = self._build_base_kwargs()
+            if name in self._CACHE_FIELDS:
+                self._initialize_caches()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the retriever, rebuilding state derived from its fields.
+
+        The copy gets request defaults and caches matching its (possibly
+        updated) fields, and does not share in-flight or prefetched requests
+        with the original.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied._base_kwargs = copied._build_base_kwargs()
+        copied._initialize_caches()
+        copied._inflight = {}
+        copied._prefetched = {}
+        return copied
+
+    @abstractmethod
+    def _build_base_kwargs(self) -> dict[str, Any]:
+        """Build the default SDK call kwargs, excluding the query."""
+
+    @abstractmethod
+    def _build_request(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        """Build the full SDK call kwargs for ``query``, honoring overrides."""
+
+    def _returns_nothing(self, **kwargs: Any) -> bool:
+        """Return whether a call with these kwargs cannot yield any Documents."""
+        return False
+
+    @abstractmethod
+    def _fetch(
+        self, request: dict[str, Any], *, use_cache: bool = True
+    ) -> list[Document]:
+        """Call the SDK synchronously and parse the response."""
+
+    @abstractmethod
+    async def _afetch(
+        self, request: dict[str, Any], *, use_cache: bool = True
+    ) -> list[Document]:
+        """Call the SDK asynchronously and parse the response."""
 
-class NimbleSearchRetriever(_NimbleClientMixin, BaseRetriever):
+    def _retrieve(
+        self, request: dict[str, Any], *, use_cache: bool = True
+    ) -> list[Document]:
+        """Fetch Documents for a request, consulting the response cache."""
+        if self._cache is None or not use_cache:
+            return self._fetch(request, use_cache=use_cache)
+
+        key = _cache_key(request)
+        docs = self._cache.get(key)
+        if docs is None:
+            docs = self._fetch(request)
+            self._cache.set(key, docs)
+        return docs
+
+    async def _aretrieve(
+        self, request: dict[str, Any], *, use_cache: bool = True
+    ) -> list[Document]:
+        """Fetch Documents for a request asynchronously, consulting the cache.
+
+        Concurrent calls for the same request share one in-flight API call
+        instead of each issuing their own.
+        """
+        key = _cache_key(request)
+        if self._cache is not None and use_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        task = self._take_prefetched(key) if use_cache else None
+        if task is None:
+            task = self._schedule(key, request, use_cache=use_cache)
+
+        # Shield so one cancelled caller does not cancel the shared request.
+        docs = await asyncio.shield(task)
+        if self._cache is not None and use_cache:
+            self._cache.set(key, docs)
+        return _copy_documents(docs)
+
+    def _schedule(
+        self, key: bytes, request: dict[str, Any], *, use_cache: bool = True
+    ) -> asyncio.Future[list[Document]]:
+        """Return the in-flight task for a request, starting one if needed.
+
+        Cached and uncached calls never share a task, so a caller bypassing
+        the caches cannot be handed results served from one.
+        """
+        inflight_key = (key, use_cache)
+        task = self._inflight.get(inflight_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._afetch(request, use_cache=use_cache))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        return task
+
+    def _take_prefetched(self, key: bytes) -> asyncio.Future[list[Document]] | None:
+        """Pop a prefetched task for ``key`` if it is usable from this loop.
+
+        Prefetches older than ``cache_ttl`` are discarded like stale cache
+        entries, so a long-idle prefetch never serves outdated results.
+        """
+        entry = self._prefetched.pop(key, None)
+        if entry is None:
+            return None
+        started_at, task = entry
+        if time.monotonic() - started_at > self.cache_ttl:
+            return None
+        if task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    async def aprefetch(self, query: str, **kwargs: Any) -> None:
+        """Start retrieving ``query`` in the background and return immediately.
+
+        A later ``ainvoke`` with the same query and kwargs awaits the
+        prefetched request instead of issuing its own, hiding the round trip
+        behind whatever the caller does in between (e.g. processing the
+        current results). Only the most recent prefetches are kept, and a
+        prefetch is only served within ``cache_ttl`` seconds of starting it;
+        calls with ``cache_disabled=True`` never consume one.
+
+        Args:
+            query: Query (or URL, for extraction) to retrieve.
+            **kwargs: Per-call overrides, as accepted by ``ainvoke``.
+        """
+        _check_query(query)
+        use_cache = not kwargs.pop("cache_disabled", False)
+        if self._returns_nothing(**kwargs):
+            return
+        request = self._build_request(query, **kwargs)
+        key = _cache_key(request)
+        if use_cache and self._cache is not None and self._cache.get(key) is not None:
+            return
+
+        task = self._schedule(key, request, use_cache=use_cache)
+        # Failures surface to whoever consumes the prefetch, not the loop.
+        task.add_done_callback(_retrieve_exception)
+        self._prefetched[key] = (time.monotonic(), task)
+        while len(self._prefetched) > _MAX_PREFETCHED:
+            del self._prefetched[next(iter(self._prefetched))]
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun,
+        **kwargs: Any,
+    ) -> list[Document]:
+        _check_query(query)
+        use_cache = not kwargs.pop("cache_disabled", False)
+        if self._returns_nothing(**kwargs):
+            return []
+        return self._retrieve(self._build_request(query, **kwargs), use_cache=use_cache)
+
+    async def _aget_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: AsyncCallbackManagerForRetrieverRun,
+        **kwargs: Any,
+    ) -> list[Document]:
+        _check_query(query)
+        use_cache = not kwargs.pop("cache_disabled", False)
+        if self._returns_nothing(**kwargs):
+            return []
+        return await self._aretrieve(
+            self._build_request(query, **kwargs), use_cache=use_cache
+        )
+
+
+class NimbleSearchRetriever(_NimbleBaseRetriever):
     """Search retriever for Nimble API.
 
     Retrieves search results with full page content extraction.
@@ -79,6 +355,10 @@ class NimbleSearchRetriever(_NimbleClientMixin, BaseRetriever):
     Args:
         api_key: API key for Nimbleway (or set NIMBLE_API_KEY env var).
         base_url: Override base URL for the Nimble API.
+        max_retries: Maximum retry attempts for retryable errors (408, 409, 429,
+            5xx and connection errors, as decided by the SDK; default: 2).
+        request_timeout: Timeout in seconds for each request attempt, so a hung
+            attempt is retried (default: SDK default).
         max_results: Maximum number of results to return (1-100, default: 3).
             Alias: k.
         focus: Search focus mode - general, news, location,
@@ -96,6 +376,13 @@ class NimbleSearchRetriever(_NimbleClientMixin, BaseRetriever):
         country: Country code (default: US).
         output_format: Content format - plain_text, markdown (default),
             simplified_html.
+        cache_size: Number of responses to cache in memory (default: 0,
+            disabled).
+        cache_ttl: Seconds a cached response stays fresh (default: 300).
+        semantic_cache_embeddings: Embeddings model used to serve cached
+            results for near-duplicate queries (requires cache_size > 0).
+        semantic_cache_threshold: Minimum cosine similarity for a semantic
+            cache hit (default: 0.95).
     """
 
     max_results: int = Field(default=3, ge=1, le=100, alias="k")
@@ -119,72 +406,179 @@ class NimbleSearchRetriever(_NimbleClientMixin, BaseRetriever):
     time_range: str | None = None
     start_date: str | None = None
     end_date: str | None = None
+    semantic_cache_embeddings: Embeddings | None = Field(
+        default=None,
+        description=(
+            "Embeddings model for serving cached results to near-duplicate "
+            "queries. Shares cache_size and cache_ttl with the response cache."
+        ),
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        gt=0,
+        le=1,
+        description="Minimum cosine similarity for a semantic cache hit.",
+    )
 
-    def _build_search_kwargs(self, query: str, **kwargs: Any) -> dict[str, Any]:
-        """Build keyword arguments for SDK search() call."""
+    _CACHE_FIELDS: ClassVar[frozenset[str]] = _NimbleBaseRetriever._CACHE_FIELDS | {
+        "semantic_cache_embeddings",
+        "semantic_cache_threshold",
+    }
+
+    _semantic_cache: _SemanticCache | None = None
+
+    def _initialize_caches(self) -> None:
+        """Also create the semantic cache when an embeddings model is set."""
+        super()._initialize_caches()
+        self._semantic_cache = None
+        if self.semantic_cache_embeddings is None:
+            return
+        if self.cache_size == 0:
+            msg = "semantic_cache_embeddings requires cache_size > 0."
+            raise ValueError(msg)
+
+        self._semantic_cache = _SemanticCache(
+            maxsize=self.cache_size,
+            ttl=self.cache_ttl,
+            threshold=self.semantic_cache_threshold,
+        )
+
+    def _build_base_kwargs(self) -> dict[str, Any]:
+        """Build SDK search() kwargs, excluding the query."""
         search_kwargs: dict[str, Any] = {
-            "query": query,
-            "max_results": kwargs.get("max_results", kwargs.get("k", self.max_results)),
-            "locale": kwargs.get("locale", self.locale),
-            "country": kwargs.get("country", self.country),
-            "output_format": kwargs.get("output_format", self.output_format),
-            "focus": kwargs.get("focus", self.focus),
-            "search_depth": kwargs.get("search_depth", self.search_depth),
+            "max_results": self.max_results,
+            "locale": self.locale,
+            "country": self.country,
+            "output_format": self.output_format,
+            "focus": self.focus,
+            "search_depth": self.search_depth,
         }
 
-        include_answer = kwargs.get("include_answer", self.include_answer)
-        if include_answer:
-            search_kwargs["include_answer"] = include_answer
+        if self.include_answer:
+            search_kwargs["include_answer"] = self.include_answer
 
-        optional_fields = (
-            "include_domains",
-            "exclude_domains",
-            "time_range",
-            "start_date",
-            "end_date",
-        )
-        for field in optional_fields:
+        for field in _OPTIONAL_SEARCH_FIELDS:
             val = getattr(self, field)
             if val is not None:
                 search_kwargs[field] = val
 
         return search_kwargs
 
-    def _get_relevant_documents(
-        self,
-        query: str,
-        *,
-        run_manager: CallbackManagerForRetrieverRun,
-        **kwargs: Any,
-    ) -> list[Document]:
+    def _returns_nothing(self, **kwargs: Any) -> bool:
+        max_results = kwargs.get("max_results", kwargs.get("k", self.max_results))
+        return bool(max_results <= 0)
+
+    def _build_request(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        """Build keyword arguments for SDK search() call."""
+        request_kwargs = self._base_kwargs
+        if kwargs:
+            request_kwargs = _apply_search_overrides(request_kwargs, kwargs)
+        return {"query": query, **request_kwargs}
+
+    def _search(self, request: dict[str, Any]) -> list[Document]:
         if self._sync_client is None:
             msg = "Sync client not initialized"
             raise RuntimeError(msg)
 
         with handle_api_errors(operation="search"):
-            search_kwargs = self._build_search_kwargs(query, **kwargs)
-            response = self._sync_client.search(**search_kwargs)
-            return _parse_search_response(response)
-
-    async def _aget_relevant_documents(
-        self,
-        query: str,
-        *,
-        run_manager: AsyncCallbackManagerForRetrieverRun,
-        **kwargs: Any,
-    ) -> list[Document]:
+            if not _should_stream(request):
+                response = self._sync_client.with_raw_response.search(**request)
+                return _parse_search_response(
+                    response.http_response.content, request["max_results"]
+                )
+
+            stream = _SearchResultStream(request["max_results"])
+            try:
+                with self._sync_client.with_streaming_response.search(
+                    **request
+                ) as streamed:
+                    for chunk in streamed.iter_bytes():
+                        if stream.feed(chunk):
+                            break
+            except httpx.TransportError:
+                # The body is read outside the SDK's retry loop, so spend the
+                # remaining retries on the buffered path instead.
+                if self._sync_client.max_retries == 0:
+                    raise
+                client = self._sync_client.with_options(
+                    max_retries=self._sync_client.max_retries - 1
+                )
+                response = client.with_raw_response.search(**request)
+                return _parse_search_response(
+                    response.http_response.content, request["max_results"]
+                )
+            return stream.close()
+
+    async def _asearch(self, request: dict[str, Any]) -> list[Document]:
         if self._async_client is None:
             msg = "Async client not initialized"
             raise RuntimeError(msg)
 
         with handle_api_errors(operation="search"):
-            response = await self._async_client.search(
-                **self._build_search_kwargs(query, **kwargs)
-            )
-            return _parse_search_response(response)
-
-
-class NimbleExtractRetriever(_NimbleClientMixin, BaseRetriever):
+            if not _should_stream(request):
+                response = await self._async_client.with_raw_response.search(**request)
+                return _parse_search_response(
+                    response.http_response.content, request["max_results"]
+                )
+
+            stream = _SearchResultStream(request["max_results"])
+            try:
+                async with self._async_client.with_streaming_response.search(
+                    **request
+                ) as streamed:
+                    async for chunk in streamed.iter_bytes():
+                        if stream.feed(chunk):
+                            break
+            except httpx.TransportError:
+                if self._async_client.max_retries == 0:
+                    raise
+                aclient = self._async_client.with_options(
+                    max_retries=self._async_client.max_retries - 1
+                )
+                response = await aclient.with_raw_response.search(**request)
+                return _parse_search_response(
+                    response.http_response.content, request["max_results"]
+                )
+            return stream.close()
+
+    def _fetch(
+        self, request: dict[str, Any], *, use_cache: bool = True
+    ) -> list[Document]:
+        if (
+            not use_cache
+            or self._semantic_cache is None
+            or self.semantic_cache_embeddings is None
+        ):
+            return self._search(request)
+
+        namespace = _semantic_namespace(request)
+        embedding = self.semantic_cache_embeddings.embed_query(request["query"])
+        docs = self._semantic_cache.get(namespace, embedding)
+        if docs is None:
+            docs = self._search(request)
+            self._semantic_cache.set(namespace, embedding, docs)
+        return docs
+
+    async def _afetch(
+        self, request: dict[str, Any], *, use_cache: bool = True
+    ) -> list[Document]:
+        if (
+            not use_cache
+            or self._semantic_cache is None
+            or self.semantic_cache_embeddings is None
+        ):
+            return await self._asearch(request)
+
+        namespace = _semantic_namespace(request)
+        embedding = await self.semantic_cache_embeddings.aembed_query(request["query"])
+        docs = self._semantic_cache.get(namespace, embedding)
+        if docs is None:
+            docs = await self._asearch(request)
+            self._semantic_cache.set(namespace, embedding, docs)
+        return docs
+
+
+class NimbleExtractRetriever(_NimbleBaseRetriever):
     """Extract retriever for Nimble API.
 
     Extracts content from a single URL passed via the query parameter.
@@ -192,6 +586,10 @@ class NimbleExtractRetriever(_NimbleClientMixin, BaseRetriever):
     Args:
         api_key: API key for Nimbleway (or set NIMBLE_API_KEY env var).
         base_url: Override base URL for the Nimble API.
+        max_retries: Maximum retry attempts for retryable errors (408, 409, 429,
+            5xx and connection errors, as decided by the SDK; default: 2).
+        request_timeout: Timeout in seconds for each request attempt, so a hung
+            attempt is retried (default: SDK default).
         locale: Locale for results (default: en).
         country: Country code (default: US).
         output_format: Content format - plain_text, markdown (default),
@@ -200,64 +598,92 @@ class NimbleExtractRetriever(_NimbleClientMixin, BaseRetriever):
             vx12, vx12-pro). If not specified, API selects the most
             appropriate driver.
         wait: Optional delay in milliseconds for render flow.
+        max_concurrency: Maximum concurrent requests in ``abatch_extract``
+            (default: 10).
+        cache_size: Number of responses to cache in memory (default: 0,
+            disabled).
+        cache_ttl: Seconds a cached response stays fresh (default: 300).
 
     Example:
         >>> retriever = NimbleExtractRetriever()
         >>> docs = await retriever.ainvoke("https://example.com")
+        >>> batches = await retriever.abatch_extract(
+        ...     ["https://example.com", "https://example.org"]
+        ... )
     """
 
     driver: BrowserlessDriver | None = None
     wait: int | None = None
+    max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum concurrent extract requests in abatch_extract().",
+    )
 
-    def _build_extract_kwargs(self, query: str, **kwargs: Any) -> dict[str, Any]:
-        """Build keyword arguments for SDK extract() call."""
+    def _build_base_kwargs(self) -> dict[str, Any]:
+        """Build SDK extract() kwargs, excluding the URL."""
         extract_kwargs: dict[str, Any] = {
-            "url": query,
-            "locale": kwargs.get("locale", self.locale),
-            "country": kwargs.get("country", self.country),
+            "locale": self.locale,
+            "country": self.country,
             "formats": ["markdown"],
         }
 
-        driver = kwargs.get("driver", self.driver)
-        if driver is not None:
-            extract_kwargs["driver"] = driver.value
+        if self.driver is not None:
+            extract_kwargs["driver"] = self.driver
 
-        wait = kwargs.get("wait", self.wait)
-        if wait is not None:
+        if self.wait is not None:
             extract_kwargs["render"] = True
-            extract_kwargs["browser_actions"] = [{"wait": f"{wait}ms"}]
+            extract_kwargs["browser_actions"] = [{"wait": f"{self.wait}ms"}]
 
         return extract_kwargs
 
-    def _get_relevant_documents(
-        self,
-        query: str,
-        *,
-        run_manager: CallbackManagerForRetrieverRun,
-        **kwargs: Any,
+    def _build_request(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        """Build keyword arguments for SDK extract() call."""
+        request_kwargs = self._base_kwargs
+        if kwargs:
+            request_kwargs = _apply_extract_overrides(request_kwargs, kwargs)
+        return {"url": query, **request_kwargs}
+
+    def _fetch(
+        self, request: dict[str, Any], *, use_cache: bool = True
     ) -> list[Document]:
         if self._sync_client is None:
             msg = "Sync client not initialized"
             raise RuntimeError(msg)
 
         with handle_api_errors(operation="extract"):
-            extract_kwargs = self._build_extract_kwargs(query, **kwargs)
-            response = self._sync_client.extract(**extract_kwargs)
-            return _parse_extract_response(response)
+            response = self._sync_client.with_raw_response.extract(**request)
+            return _parse_extract_response(response.http_response.content)
 
-    async def _aget_relevant_documents(
-        self,
-        query: str,
-        *,
-        run_manager: AsyncCallbackManagerForRetrieverRun,
-        **kwargs: Any,
+    async def _afetch(
+        self, request: dict[str, Any], *, use_cache: bool = True
     ) -> list[Document]:
         if self._async_client is None:
             msg = "Async client not initialized"
             raise RuntimeError(msg)
 
         with handle_api_errors(operation="extract"):
-            response = await self._async_client.extract(
-                **self._build_extract_kwargs(query, **kwargs)
-            )
-            return _parse_extract_response(response)
+            response = await self._async_client.with_raw_response.extract(**request)
+            return _parse_extract_response(response.http_response.content)
+
+    async def abatch_extract(
+        self, urls: list[str], **kwargs: Any
+    ) -> list[list[Document]]:
+        """Extract several URLs concurrently.
+
+        Each URL goes through ``ainvoke`` (validation, caching and callbacks
+        included) and requests run in parallel, bounded by
+        ``max_concurrency``, so total latency is close to the slowest URL
+        rather than the sum of all.
+
+        Args:
+            urls: URLs to extract.
+            **kwargs: Per-call overrides applied to every URL, as accepted by
+                ``ainvoke`` (locale, country, driver, wait, cache_disabled).
+
+        Returns:
+            One Document list per URL, in input order.
+        """
+        return await self.abatch(
+            urls, config={"max_concurrency": self.max_concurrency}, **kwargs
+        )
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 from langchain_core.tools import BaseTool, BaseToolkit
-from langchain_core.utils import secret_from_env
-from pydantic import Field, SecretStr
+from pydantic import Field
 
+from langchain_nimble._utilities import _NimbleClientConfig
 
-class NimbleToolkit(BaseToolkit):
+
+class NimbleToolkit(_NimbleClientConfig, BaseToolkit):
     """Toolkit providing all Nimble API tools for LangChain agents.
 
     Use ``include_*`` flags to control which tools are returned.
-    All tools share the same API key and client configuration.
+    All tools share the same API key and client configuration
+    (``base_url``, ``max_retries`` and ``request_timeout``, the timeout in
+    seconds for each request attempt).
 
     By default, only Search and Extract tools are enabled. Crawl, Map,
     and Agent tools are opt-in.
@@ -23,23 +26,6 @@ class NimbleToolkit(BaseToolkit):
         # Returns [NimbleSearchTool, NimbleExtractTool, NimbleMapTool]
     """
 
-    nimble_api_key: SecretStr = Field(
-        alias="api_key",
-        default_factory=secret_from_env("NIMBLE_API_KEY", default=""),
-        description="API key for Nimbleway (or set NIMBLE_API_KEY env var).",
-    )
-    nimble_api_url: str | None = Field(
-        alias="base_url",
-        default=None,
-        description="Override base URL for the Nimble API.",
-    )
-    max_retries: int = Field(
-        default=2,
-        ge=0,
-        le=5,
-        description="Maximum retry attempts for 5xx errors.",
-    )
-
     include_search: bool = Field(
         default=True,
         description="Include NimbleSearchTool.",
@@ -84,6 +70,8 @@ class NimbleToolkit(BaseToolkit):
         }
         if self.nimble_api_url is not None:
             common_kwargs["base_url"] = self.nimble_api_url
+        if self.request_timeout is not None:
+            common_kwargs["request_timeout"] = self.request_timeout
 
         tools: list[BaseTool] = []
 
@@ -56,7 +56,10 @@ class NimbleAgentListTool(_NimbleClientMixin, BaseTool):
     Args:
         api_key: API key for Nimbleway (or set NIMBLE_API_KEY env var).
         base_url: Override base URL for the Nimble API.
-        max_retries: Maximum retry attempts for 5xx errors (default: 2).
+        max_retries: Maximum retry attempts for retryable errors (408, 409, 429,
+            5xx and connection errors, as decided by the SDK; default: 2).
+        request_timeout: Timeout in seconds for each request attempt, so a hung
+            attempt is retried (default: SDK default).
     """
 
     name: str = "nimble_agent_list"
@@ -167,7 +170,10 @@ class NimbleAgentGetTool(_NimbleClientMixin, BaseTool):
     Args:
         api_key: API key for Nimbleway (or set NIMBLE_API_KEY env var).
         base_url: Override base URL for the Nimble API.
-        max_retries: Maximum retry attempts for 5xx errors (default: 2).
+        max_retries: Maximum retry attempts for retryable errors (408, 409, 429,
+            5xx and connection errors, as decided by the SDK; default: 2).
+        request_timeout: Timeout in seconds for each request attempt, so a hung
+            attempt is retried (default: SDK default).
     """
 
     name: str = "nimble_agent_get"
@@ -248,7 +254,10 @@ class NimbleAgentRunTool(_NimbleClientMixin, BaseTool):
     Args:
         api_key: API key for Nimbleway (or set NIMBLE_API_KEY env var).
         base_url: Override base URL for the Nimble API.
-        max_retries: Maximum retry attempts for 5xx errors (default: 2).
+        max_retries: Maximum retry attempts for retryable errors (408, 409, 429,
+            5xx and connection errors, as decided by the SDK; default: 2).
+        request_timeout: Timeout in seconds for each request attempt, so a hung
+            attempt is retried (default: SDK default).
         locale: Locale for results (default: en).
         country: Country code (default: US).
     """
@@ -30,7 +30,10 @@ class NimbleExtractTool(_NimbleClientMixin, BaseTool):
     Args:
         api_key: API key for Nimbleway (or set NIMBLE_API_KEY env var).
         base_url: Override base URL for the Nimble API.
-        max_retries: Maximum retry attempts for 5xx errors (default: 2).
+        max_retries: Maximum retry attempts for retryable errors (408, 409, 429,
+            5xx and connection errors, as decided by the SDK; default: 2).
+        request_timeout: Timeout in seconds for each request attempt, so a hung
+            attempt is retried (default: SDK default).
         locale: Locale for results (default: en).
         country: Country code (default: US).
     """
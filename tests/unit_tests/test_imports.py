@@ -1,5 +1,8 @@
 """Test basic imports to verify package installation."""
 
+import subprocess
+import sys
+
 from langchain_nimble import __all__
 
 EXPECTED_ALL = [
@@ -22,3 +25,18 @@ EXPECTED_ALL = [
 def test_all_imports() -> None:
     """Test that all expected imports are in `__all__`."""
     assert sorted(EXPECTED_ALL) == sorted(__all__)
+
+
+def test_exports_resolve_lazily() -> None:
+    """Test importing the package defers submodules until a name is used."""
+    code = (
+        "import sys, langchain_nimble\n"
+        "assert 'langchain_nimble.retrievers' not in sys.modules\n"
+        "assert 'langchain_nimble.tools.search_tool' not in sys.modules\n"
+        "from langchain_nimble import NimbleSearchRetriever\n"
+        "assert 'langchain_nimble.retrievers' in sys.modules\n"
+        "assert 'langchain_nimble.tools.search_tool' not in sys.modules\n"
+        "for name in langchain_nimble.__all__:\n"
+        "    getattr(langchain_nimble, name)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -0,0 +1,868 @@
+"""Unit tests for Nimble retrievers."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.tools import ToolException
+from nimble_python import AsyncNimble, Nimble
+
+from langchain_nimble import NimbleExtractRetriever, NimbleSearchRetriever
+from langchain_nimble._types import BrowserlessDriver
+from langchain_nimble.retrievers import _NimbleBaseRetriever
+
+
+class _KeywordEmbeddings(Embeddings):
+    """Embed texts by whether they mention Paris or weather."""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        lowered = text.lower()
+        return [float("paris" in lowered), float("weather" in lowered), 0.1]
+
+
+def _raw_api(client: Nimble | AsyncNimble | None) -> Any:
+    """Return the client's raw-response API for patching."""
+    assert client is not None
+    return client.with_raw_response
+
+
+def _streaming_api(client: Nimble | AsyncNimble | None) -> Any:
+    """Return the client's streaming-response API for patching."""
+    assert client is not None
+    return client.with_streaming_response
+
+
+def _raw_response(payload: dict[str, Any]) -> MagicMock:
+    """Wrap a JSON payload as a raw SDK response."""
+    raw = MagicMock()
+    raw.http_response.content = orjson.dumps(payload)
+    return raw
+
+
+def _mock_search_response() -> MagicMock:
+    """Create a raw search response with a single SERP result."""
+    return _raw_response(
+        {
+            "request_id": "test-request-id",
+            "results": [
+                {
+                    "title": "Test Title",
+                    "url": "https://example.com",
+                    "description": "Test description",
+                    "content": "Test content",
+                    "metadata": {
+                        "position": 1,
+                        "entity_type": "organic",
+                        "country": "US",
+                        "locale": "en",
+                    },
+                }
+            ],
+            "total_results": 1,
+        }
+    )
+
+
+def _mock_extract_response(url: str, markdown: str | None) -> MagicMock:
+    """Create a raw extract response for a URL."""
+    return _raw_response({"url": url, "data": {"markdown": markdown}})
+
+
+def test_search_retriever_invoke() -> None:
+    """Test search retriever converts results to Documents."""
+    retriever = NimbleSearchRetriever(api_key="test_key", k=5, focus="news")
+
+    with patch.object(
+        _raw_api(retriever._sync_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        docs = retriever.invoke("test query")
+
+    assert len(docs) == 1
+    assert docs[0].page_content == "Test content"
+    assert docs[0].metadata["position"] == 1
+    assert docs[0].metadata["entity_type"] == "organic"
+
+    call_kwargs = mock_search.call_args.kwargs
+    assert call_kwargs["query"] == "test query"
+    assert call_kwargs["max_results"] == 5
+    assert call_kwargs["focus"] == "news"
+
+
+def test_search_retriever_wsa_metadata_defaults() -> None:
+    """Test results without SERP metadata fall back to default fields."""
+    retriever = NimbleSearchRetriever(api_key="test_key", focus="shopping")
+    raw = _raw_response(
+        {
+            "results": [
+                {
+                    "title": "Laptop",
+                    "url": "https://shop.example.com",
+                    "description": "",
+                    "content": None,
+                    "metadata": {"agent_name": "shopping"},
+                }
+            ]
+        }
+    )
+
+    with patch.object(_raw_api(retriever._sync_client), "search", return_value=raw):
+        docs = retriever.invoke("laptop")
+
+    assert docs[0].page_content == ""
+    assert docs[0].metadata["position"] == -1
+    assert docs[0].metadata["entity_type"] == ""
+
+
+def _streamed_response(payload: dict[str, Any], chunk_size: int = 16) -> MagicMock:
+    """Create a streaming SDK response yielding the payload in small chunks."""
+    body = orjson.dumps(payload)
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+    async def _aiter_bytes() -> Any:
+        for chunk in chunks:
+            yield chunk
+
+    streamed = MagicMock()
+    streamed.iter_bytes.return_value = iter(chunks)
+    streamed.__aenter__.return_value.iter_bytes = _aiter_bytes
+    streamed.__enter__.return_value = streamed
+    return streamed
+
+
+def _deep_search_payload() -> dict[str, Any]:
+    return {
+        "request_id": "test-request-id",
+        "results": [
+            {
+                "title": f"Title {i}",
+                "url": f"https://example.com/{i}",
+                "description": "",
+                "content": f"Full page content {i}",
+                "metadata": {"position": i, "entity_type": "organic"},
+            }
+            for i in range(3)
+        ],
+        "total_results": 3,
+    }
+
+
+def test_search_retriever_streams_deep_search() -> None:
+    """Test deep searches are parsed incrementally from a streamed body."""
+    pytest.importorskip("ijson")
+    retriever = NimbleSearchRetriever(api_key="test_key", search_depth="deep")
+    streamed = _streamed_response(_deep_search_payload())
+
+    with (
+        patch.object(
+            _streaming_api(retriever._sync_client), "search", return_value=streamed
+        ),
+        patch.object(_raw_api(retriever._sync_client), "search") as mock_raw,
+    ):
+        docs = retriever.invoke("test query")
+
+    mock_raw.assert_not_called()
+    assert [doc.page_content for doc in docs] == [
+        f"Full page content {i}" for i in range(3)
+    ]
+    assert docs[2].metadata["position"] == 2
+
+
+async def test_search_retriever_streams_deep_search_async() -> None:
+    """Test async deep searches are parsed incrementally from a streamed body."""
+    pytest.importorskip("ijson")
+    retriever = NimbleSearchRetriever(api_key="test_key", search_depth="deep")
+    streamed = _streamed_response(_deep_search_payload())
+
+    with patch.object(
+        _streaming_api(retriever._async_client), "search", return_value=streamed
+    ):
+        docs = await retriever.ainvoke("test query")
+
+    assert len(docs) == 3
+    assert docs[0].metadata["url"] == "https://example.com/0"
+
+
+class _BrokenBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that times out after its first chunk."""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.body[:16]
+        msg = "body stalled"
+        raise httpx.ReadTimeout(msg)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.body[:16]
+        msg = "body stalled"
+        raise httpx.ReadTimeout(msg)
+
+
+def _flaky_transport(failures: int) -> tuple[httpx.MockTransport, list[int]]:
+    """Serve deep search results, breaking the first ``failures`` bodies."""
+    body = orjson.dumps(_deep_search_payload())
+    attempts: list[int] = []
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        attempts.append(len(attempts))
+        if len(attempts) <= failures:
+            return httpx.Response(200, stream=_BrokenBody(body))
+        return httpx.Response(200, content=body)
+
+    return httpx.MockTransport(handler), attempts
+
+
+def _deep_retriever(transport: httpx.MockTransport, max_retries: int) -> Any:
+    """Create a deep search retriever whose sync client uses ``transport``."""
+    retriever = NimbleSearchRetriever(
+        api_key="test_key", search_depth="deep", max_retries=max_retries
+    )
+    assert retriever._sync_client is not None
+    retriever._sync_client = retriever._sync_client.with_options(
+        http_client=httpx.Client(transport=transport)
+    )
+    return retriever
+
+
+def test_search_retriever_stream_failure_retried() -> None:
+    """Test a body failing mid-stream is retried through the buffered path."""
+    pytest.importorskip("ijson")
+    transport, attempts = _flaky_transport(1)
+
+    docs = _deep_retriever(transport, max_retries=1).invoke("test query")
+
+    assert len(docs) == 3
+    assert len(attempts) == 2
+
+
+@pytest.mark.parametrize("max_retries", [0, 1])
+def test_search_retriever_stream_failure_raises_tool_exception(
+    max_retries: int,
+) -> None:
+    """Test mid-stream failures honor max_retries and map to ToolException."""
+    pytest.importorskip("ijson")
+    transport, attempts = _flaky_transport(5)
+    retriever = _deep_retriever(transport, max_retries=max_retries)
+
+    with pytest.raises(ToolException, match="timed out"):
+        retriever.invoke("test query")
+    assert len(attempts) == max_retries + 1
+
+
+async def test_search_retriever_stream_failure_retried_async() -> None:
+    """Test an async body failing mid-stream falls back to a buffered retry."""
+    pytest.importorskip("ijson")
+    retriever = NimbleSearchRetriever(
+        api_key="test_key", search_depth="deep", max_retries=1
+    )
+    transport, attempts = _flaky_transport(1)
+    client = retriever._async_client
+    assert client is not None
+    retriever._async_client_instance = client.with_options(
+        http_client=httpx.AsyncClient(transport=transport)
+    )
+
+    docs = await retriever.ainvoke("test query")
+
+    assert len(docs) == 3
+    assert len(attempts) == 2
+
+
+def test_search_retriever_interns_entity_type() -> None:
+    """Test repeated entity types share one string object across results."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+    raw = _raw_response(_deep_search_payload())
+
+    with patch.object(_raw_api(retriever._sync_client), "search", return_value=raw):
+        docs = retriever.invoke("test query")
+
+    assert docs[0].metadata["entity_type"] == "organic"
+    assert docs[0].metadata["entity_type"] is docs[2].metadata["entity_type"]
+
+
+def test_search_retriever_limits_results_to_max_results() -> None:
+    """Test surplus results beyond max_results are not turned into Documents."""
+    retriever = NimbleSearchRetriever(api_key="test_key", k=2)
+    raw = _raw_response(_deep_search_payload())
+
+    with patch.object(_raw_api(retriever._sync_client), "search", return_value=raw):
+        docs = retriever.invoke("test query")
+
+    assert [doc.metadata["position"] for doc in docs] == [0, 1]
+
+
+def test_search_retriever_stream_stops_at_max_results() -> None:
+    """Test streamed deep searches stop reading once max_results are parsed."""
+    pytest.importorskip("ijson")
+    retriever = NimbleSearchRetriever(api_key="test_key", search_depth="deep", k=1)
+    streamed = _streamed_response(_deep_search_payload())
+    chunks = streamed.iter_bytes.return_value
+
+    with patch.object(
+        _streaming_api(retriever._sync_client), "search", return_value=streamed
+    ):
+        docs = retriever.invoke("test query")
+
+    assert [doc.page_content for doc in docs] == ["Full page content 0"]
+    assert next(chunks, None) is not None
+
+
+def test_search_retriever_missing_metadata() -> None:
+    """Test results without a metadata object get default metadata fields."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+    raw = _raw_response({"results": [{"title": "No metadata", "url": "u"}]})
+
+    with patch.object(_raw_api(retriever._sync_client), "search", return_value=raw):
+        docs = retriever.invoke("query")
+
+    assert docs[0].metadata == {
+        "title": "No metadata",
+        "description": "",
+        "url": "u",
+        "position": -1,
+        "entity_type": "",
+    }
+
+
+def test_search_retriever_kwargs_override_defaults() -> None:
+    """Test per-call kwargs override the precomputed defaults."""
+    retriever = NimbleSearchRetriever(api_key="test_key", include_answer=True)
+
+    kwargs = retriever._build_request("query", max_results=7, include_answer=False)
+
+    assert kwargs["max_results"] == 7
+    assert "include_answer" not in kwargs
+    assert retriever._build_request("query")["include_answer"] is True
+
+
+def test_search_retriever_override_precedence() -> None:
+    """Test max_results overrides win over k and unknown kwargs are ignored."""
+    retriever = NimbleSearchRetriever(api_key="test_key", focus="news")
+
+    by_k = retriever._build_request("query", k=4, unknown="x")
+    both = retriever._build_request("query", k=4, max_results=9, country="FR")
+
+    assert by_k["max_results"] == 4
+    assert by_k["focus"] == "news"
+    assert "unknown" not in by_k
+    assert both["max_results"] == 9
+    assert both["country"] == "FR"
+    assert retriever._build_request("query")["max_results"] == 3
+
+
+def test_extract_retriever_kwargs_override_defaults() -> None:
+    """Test per-call extract kwargs override the precomputed defaults."""
+    retriever = NimbleExtractRetriever(
+        api_key="test_key", driver=BrowserlessDriver.VX8, wait=500
+    )
+
+    waited = retriever._build_request("https://example.com", wait=100, country="FR")
+    bare = retriever._build_request("https://example.com", wait=None, driver=None)
+
+    assert waited["browser_actions"] == [{"wait": "100ms"}]
+    assert waited["country"] == "FR"
+    assert waited["driver"] is BrowserlessDriver.VX8
+    assert "render" not in bare
+    assert "browser_actions" not in bare
+    assert "driver" not in bare
+    assert retriever._build_request("https://example.com")["browser_actions"] == [
+        {"wait": "500ms"}
+    ]
+
+
+def test_base_retriever_is_abstract() -> None:
+    """Test the base retriever cannot be used without its request hooks."""
+    with pytest.raises(TypeError, match="abstract"):
+        _NimbleBaseRetriever(api_key="test_key")  # type: ignore[abstract]
+
+
+@pytest.mark.parametrize("query", ["", "   "])
+async def test_retrievers_reject_blank_query(query: str) -> None:
+    """Test blank queries raise locally without calling the API."""
+    search = NimbleSearchRetriever(api_key="test_key")
+    extract = NimbleExtractRetriever(api_key="test_key")
+
+    with (
+        patch.object(_raw_api(search._sync_client), "search") as mock_search,
+        patch.object(_raw_api(extract._async_client), "extract") as mock_extract,
+    ):
+        with pytest.raises(ToolException, match="non-empty"):
+            search.invoke(query)
+        with pytest.raises(ToolException, match="non-empty"):
+            await extract.ainvoke(query)
+
+    mock_search.assert_not_called()
+    mock_extract.assert_not_called()
+
+
+async def test_search_retriever_non_positive_k_skips_request() -> None:
+    """Test a per-call k of zero returns no Documents without calling the API."""
+    embeddings = _KeywordEmbeddings()
+    retriever = NimbleSearchRetriever(
+        api_key="test_key", cache_size=8, semantic_cache_embeddings=embeddings
+    )
+
+    with (
+        patch.object(_raw_api(retriever._sync_client), "search") as mock_search,
+        patch.object(_raw_api(retriever._async_client), "search") as mock_asearch,
+        patch.object(embeddings, "embed_query") as mock_embed,
+    ):
+        docs = retriever.invoke("query", k=0)
+        adocs = await retriever.ainvoke("query", max_results=0)
+
+    assert docs == adocs == []
+    mock_search.assert_not_called()
+    mock_asearch.assert_not_called()
+    mock_embed.assert_not_called()
+    assert retriever._cache is not None
+    assert not retriever._cache._entries
+
+
+def test_search_retriever_assignment_refreshes_defaults() -> None:
+    """Test assigning a field after construction updates request kwargs."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+    retriever.max_results = 9
+    retriever.include_domains = ["example.com"]
+
+    kwargs = retriever._build_request("query")
+
+    assert kwargs["max_results"] == 9
+    assert kwargs["include_domains"] == ["example.com"]
+
+
+def test_search_retriever_model_copy_rebuilds_state() -> None:
+    """Test copies send their own fields and share no request bookkeeping."""
+    retriever = NimbleSearchRetriever(api_key="test_key", cache_size=8)
+
+    copied = retriever.model_copy(update={"max_results": 7})
+
+    assert copied._build_request("query")["max_results"] == 7
+    assert retriever._build_request("query")["max_results"] == 3
+    assert copied._cache is not retriever._cache
+    assert copied._inflight is not retriever._inflight
+    assert copied._prefetched is not retriever._prefetched
+
+
+def test_search_retriever_assignment_rebuilds_caches() -> None:
+    """Test assigning cache settings after construction takes effect."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+    retriever.cache_size = 8
+    retriever.semantic_cache_embeddings = _KeywordEmbeddings()
+
+    assert retriever._cache is not None
+    assert retriever._cache.maxsize == 8
+    assert retriever._semantic_cache is not None
+
+    retriever.semantic_cache_embeddings = None
+    retriever.cache_size = 0
+    assert retriever._semantic_cache is None
+    assert retriever._cache is None
+
+
+def test_extract_retriever_invoke() -> None:
+    """Test extract retriever passes the query as the URL."""
+    retriever = NimbleExtractRetriever(api_key="test_key", wait=500)
+    mock_response = _mock_extract_response("https://example.com", "# Title")
+
+    with patch.object(
+        _raw_api(retriever._sync_client), "extract", return_value=mock_response
+    ) as mock_extract:
+        docs = retriever.invoke("https://example.com")
+
+    assert docs[0].page_content == "# Title"
+    call_kwargs = mock_extract.call_args.kwargs
+    assert call_kwargs["url"] == "https://example.com"
+    assert call_kwargs["render"] is True
+    assert call_kwargs["browser_actions"] == [{"wait": "500ms"}]
+
+
+def test_extract_retriever_driver_passthrough() -> None:
+    """Test drivers are sent as given, whether enum members or strings."""
+    retriever = NimbleExtractRetriever(api_key="test_key", driver=BrowserlessDriver.VX8)
+    mock_response = _mock_extract_response("https://example.com", "# Title")
+
+    with patch.object(
+        _raw_api(retriever._sync_client), "extract", return_value=mock_response
+    ) as mock_extract:
+        retriever.invoke("https://example.com")
+        retriever.invoke("https://example.com", driver="vx10")
+
+    first, second = (call.kwargs for call in mock_extract.call_args_list)
+    assert first["driver"] is BrowserlessDriver.VX8
+    assert second["driver"] == "vx10"
+
+
+def test_search_retriever_cache_hit() -> None:
+    """Test identical queries are served from the cache when enabled."""
+    retriever = NimbleSearchRetriever(api_key="test_key", cache_size=8)
+
+    with patch.object(
+        _raw_api(retriever._sync_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        first = retriever.invoke("test query")
+        second = retriever.invoke("test query")
+        retriever.invoke("other query")
+
+    assert first == second
+    assert mock_search.call_count == 2
+
+
+def test_search_retriever_cache_isolated_from_caller_mutation() -> None:
+    """Test mutating returned Documents does not alter cached entries."""
+    retriever = NimbleSearchRetriever(api_key="test_key", cache_size=8)
+
+    with patch.object(
+        _raw_api(retriever._sync_client),
+        "search",
+        return_value=_mock_search_response(),
+    ):
+        first = retriever.invoke("test query")
+        first[0].metadata["score"] = 0.9
+        second = retriever.invoke("test query")
+
+    assert "score" not in second[0].metadata
+    assert second[0].page_content == first[0].page_content
+
+
+def test_search_retriever_cache_disabled_kwarg() -> None:
+    """Test cache_disabled bypasses the cache for a single call."""
+    retriever = NimbleSearchRetriever(api_key="test_key", cache_size=8)
+
+    with patch.object(
+        _raw_api(retriever._sync_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        retriever.invoke("test query")
+        retriever.invoke("test query", cache_disabled=True)
+
+    assert mock_search.call_count == 2
+    assert "cache_disabled" not in mock_search.call_args.kwargs
+
+
+def test_search_retriever_cache_expires() -> None:
+    """Test cached responses are refetched after the TTL elapses."""
+    retriever = NimbleSearchRetriever(api_key="test_key", cache_size=8, cache_ttl=60)
+
+    with (
+        patch.object(
+            _raw_api(retriever._sync_client),
+            "search",
+            return_value=_mock_search_response(),
+        ) as mock_search,
+        patch("langchain_nimble._cache.time") as mock_time,
+    ):
+        mock_time.monotonic.side_effect = [0.0, 30.0, 90.0, 90.0]
+        retriever.invoke("test query")
+        retriever.invoke("test query")
+        retriever.invoke("test query")
+
+    assert mock_search.call_count == 2
+
+
+async def test_search_retriever_async_cache_hit() -> None:
+    """Test the async path shares the response cache."""
+    retriever = NimbleSearchRetriever(api_key="test_key", cache_size=8)
+
+    with patch.object(
+        _raw_api(retriever._async_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        await retriever.ainvoke("test query")
+        await retriever.ainvoke("test query")
+
+    mock_search.assert_awaited_once()
+
+
+def test_search_retriever_semantic_cache_hit() -> None:
+    """Test near-duplicate queries are served from the semantic cache."""
+    retriever = NimbleSearchRetriever(
+        api_key="test_key",
+        cache_size=8,
+        semantic_cache_embeddings=_KeywordEmbeddings(),
+    )
+
+    with patch.object(
+        _raw_api(retriever._sync_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        first = retriever.invoke("weather in Paris")
+        second = retriever.invoke("Paris weather today")
+        retriever.invoke("stock prices")
+
+    assert first == second
+    assert mock_search.call_count == 2
+
+
+def test_search_retriever_semantic_cache_namespaced() -> None:
+    """Test semantic hits require matching request parameters."""
+    retriever = NimbleSearchRetriever(
+        api_key="test_key",
+        cache_size=8,
+        semantic_cache_embeddings=_KeywordEmbeddings(),
+    )
+
+    with patch.object(
+        _raw_api(retriever._sync_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        retriever.invoke("weather in Paris")
+        retriever.invoke("Paris weather today", country="FR")
+
+    assert mock_search.call_count == 2
+
+
+async def test_search_retriever_semantic_cache_async() -> None:
+    """Test the async path uses the semantic cache."""
+    retriever = NimbleSearchRetriever(
+        api_key="test_key",
+        cache_size=8,
+        semantic_cache_embeddings=_KeywordEmbeddings(),
+    )
+
+    with patch.object(
+        _raw_api(retriever._async_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        await retriever.ainvoke("weather in Paris")
+        await retriever.ainvoke("Paris weather today")
+
+    mock_search.assert_awaited_once()
+
+
+async def test_search_retriever_semantic_cache_disabled() -> None:
+    """Test cache_disabled bypasses the semantic cache on both paths."""
+    retriever = NimbleSearchRetriever(
+        api_key="test_key",
+        cache_size=8,
+        semantic_cache_embeddings=_KeywordEmbeddings(),
+    )
+
+    with (
+        patch.object(
+            _raw_api(retriever._sync_client),
+            "search",
+            return_value=_mock_search_response(),
+        ) as mock_search,
+        patch.object(
+            _raw_api(retriever._async_client),
+            "search",
+            return_value=_mock_search_response(),
+        ) as mock_asearch,
+    ):
+        retriever.invoke("weather in Paris")
+        retriever.invoke("Paris weather today", cache_disabled=True)
+        await retriever.ainvoke("Paris weather today", cache_disabled=True)
+        retriever.invoke("Paris weather", cache_disabled=True)
+
+    assert mock_search.call_count == 3
+    mock_asearch.assert_awaited_once()
+    assert retriever._semantic_cache is not None
+    assert len(retriever._semantic_cache._entries) == 1
+
+
+def test_search_retriever_semantic_cache_requires_cache_size() -> None:
+    """Test semantic caching is rejected when caching is disabled."""
+    with pytest.raises(ValueError, match="cache_size"):
+        NimbleSearchRetriever(
+            api_key="test_key", semantic_cache_embeddings=_KeywordEmbeddings()
+        )
+
+
+async def test_extract_retriever_abatch_extract() -> None:
+    """Test abatch_extract runs bounded concurrent requests in input order."""
+    retriever = NimbleExtractRetriever(api_key="test_key", max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def _extract(**kwargs: Any) -> MagicMock:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _mock_extract_response(kwargs["url"], f"content of {kwargs['url']}")
+
+    urls = [f"https://example.com/{i}" for i in range(5)]
+    with patch.object(
+        _raw_api(retriever._async_client), "extract", side_effect=_extract
+    ):
+        results = await retriever.abatch_extract(urls)
+
+    assert [docs[0].metadata["url"] for docs in results] == urls
+    assert results[3][0].page_content == "content of https://example.com/3"
+    assert peak == 2
+
+
+async def test_extract_retriever_abatch_extract_rejects_blank_urls() -> None:
+    """Test abatch_extract validates each URL like ainvoke does."""
+    retriever = NimbleExtractRetriever(api_key="test_key")
+
+    with (
+        patch.object(_raw_api(retriever._async_client), "extract") as mock_extract,
+        pytest.raises(ToolException, match="non-empty"),
+    ):
+        await retriever.abatch_extract(["", "   "])
+
+    mock_extract.assert_not_called()
+
+
+async def test_extract_retriever_abatch_extract_cache_disabled() -> None:
+    """Test abatch_extract honors cache_disabled."""
+    retriever = NimbleExtractRetriever(api_key="test_key", cache_size=8)
+    url = "https://example.com"
+
+    with patch.object(
+        _raw_api(retriever._async_client),
+        "extract",
+        return_value=_mock_extract_response(url, "# Title"),
+    ) as mock_extract:
+        await retriever.abatch_extract([url])
+        await retriever.abatch_extract([url])
+        await retriever.abatch_extract([url], cache_disabled=True)
+
+    assert mock_extract.await_count == 2
+
+
+async def test_search_retriever_abatch_runs_concurrently() -> None:
+    """Test abatch overlaps requests natively, bounded by max_concurrency."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+    in_flight = 0
+    peak = 0
+
+    async def _search(**_: Any) -> MagicMock:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _mock_search_response()
+
+    queries = [f"query {i}" for i in range(6)]
+    with patch.object(
+        _raw_api(retriever._async_client), "search", side_effect=_search
+    ) as mock_search:
+        results = await retriever.abatch(queries, config={"max_concurrency": 3})
+
+    assert len(results) == 6
+    assert mock_search.await_count == 6
+    assert peak == 3
+
+
+async def test_search_retriever_coalesces_concurrent_requests() -> None:
+    """Test concurrent identical ainvoke calls share one API request."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+
+    async def _search(**_: Any) -> MagicMock:
+        await asyncio.sleep(0.01)
+        return _mock_search_response()
+
+    with patch.object(
+        _raw_api(retriever._async_client), "search", side_effect=_search
+    ) as mock_search:
+        results = await asyncio.gather(
+            retriever.ainvoke("test query"),
+            retriever.ainvoke("test query"),
+            retriever.ainvoke("other query"),
+        )
+
+    assert results[0] == results[1]
+    assert results[0] is not results[1]
+    assert mock_search.await_count == 2
+    assert retriever._inflight == {}
+
+    results[0][0].metadata["title"] = "changed"
+    assert results[1][0].metadata["title"] == "Test Title"
+
+
+async def test_search_retriever_aprefetch() -> None:
+    """Test ainvoke consumes a completed prefetch instead of refetching."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+
+    with patch.object(
+        _raw_api(retriever._async_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        await retriever.aprefetch("next query", k=5)
+        await asyncio.sleep(0)
+        docs = await retriever.ainvoke("next query", k=5)
+        await retriever.ainvoke("next query", k=5)
+
+    assert docs[0].page_content == "Test content"
+    assert mock_search.await_count == 2
+    assert retriever._prefetched == {}
+
+
+async def test_search_retriever_aprefetch_expires_after_ttl() -> None:
+    """Test a prefetch older than cache_ttl is discarded and refetched."""
+    retriever = NimbleSearchRetriever(api_key="test_key", cache_ttl=60)
+
+    with (
+        patch.object(
+            _raw_api(retriever._async_client),
+            "search",
+            return_value=_mock_search_response(),
+        ) as mock_search,
+        patch("langchain_nimble.retrievers.time") as mock_time,
+    ):
+        mock_time.monotonic.side_effect = [0.0, 90.0]
+        await retriever.aprefetch("query")
+        # Let the prefetch finish and leave the in-flight table.
+        for _ in range(3):
+            await asyncio.sleep(0)
+        await retriever.ainvoke("query")
+
+    assert mock_search.await_count == 2
+    assert retriever._prefetched == {}
+
+
+async def test_search_retriever_aprefetch_skipped_when_cache_disabled() -> None:
+    """Test cache_disabled calls fetch fresh instead of using a prefetch."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+
+    with patch.object(
+        _raw_api(retriever._async_client),
+        "search",
+        return_value=_mock_search_response(),
+    ) as mock_search:
+        await retriever.aprefetch("query")
+        await asyncio.sleep(0)
+        await retriever.ainvoke("query", cache_disabled=True)
+        assert mock_search.await_count == 2
+        await retriever.ainvoke("query")
+
+    assert mock_search.await_count == 2
+    assert retriever._prefetched == {}
+
+
+async def test_search_retriever_aprefetch_error_raised_on_consume() -> None:
+    """Test a failed prefetch raises from the ainvoke that consumes it."""
+    retriever = NimbleSearchRetriever(api_key="test_key")
+
+    with patch.object(
+        _raw_api(retriever._async_client),
+        "search",
+        side_effect=RuntimeError("boom"),
+    ):
+        await retriever.aprefetch("query")
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError, match="boom"):
+            await retriever.ainvoke("query")
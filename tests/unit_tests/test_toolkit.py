@@ -98,6 +98,15 @@ def test_toolkit_passes_base_url() -> None:
         assert tool.nimble_api_url == "https://custom.api.com"  # type: ignore[union-attr]
 
 
+def test_toolkit_passes_request_timeout() -> None:
+    """Test toolkit passes request_timeout to all tools."""
+    toolkit = NimbleToolkit(api_key="test_key", request_timeout=15.0, include_map=True)
+    tools = toolkit.get_tools()
+
+    for tool in tools:
+        assert tool.request_timeout == 15.0  # type: ignore[attr-defined]
+
+
 def test_toolkit_passes_crawl_config() -> None:
     """Test toolkit passes crawl-specific config to crawl tool."""
     toolkit = NimbleToolkit(
@@ -1,8 +1,26 @@
 """Unit tests for client utility functions."""
 
-from nimble_python import AsyncNimble, Nimble
+import asyncio
+import gc
+import socket
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import patch
 
-from langchain_nimble._utilities import _NimbleClientMixin
+import httpx
+import pytest
+from nimble_python import AsyncNimble, BadRequestError, Nimble
+
+from langchain_nimble._utilities import (
+    _SYNC_CLIENTS,
+    _AsyncHttpxClientWrapper,
+    _close_sync_clients,
+    _NimbleClientMixin,
+    _SyncHttpxClientWrapper,
+    create_sync_client,
+)
 
 
 def test_sync_client_creation() -> None:
@@ -36,3 +54,211 @@ def test_max_retries_config() -> None:
 
     assert mixin.max_retries == 3
     assert isinstance(mixin._sync_client, Nimble)
+
+
+def test_http_clients_use_http2_pool() -> None:
+    """Test SDK clients share an HTTP/2 pool with long-lived keep-alive."""
+    mixin = _NimbleClientMixin(api_key="test-key")
+
+    assert mixin._sync_client is not None
+    assert mixin._async_client is not None
+    sync_http = mixin._sync_client._client
+    async_http = mixin._async_client._client
+    assert isinstance(sync_http, _SyncHttpxClientWrapper)
+    assert isinstance(async_http, _AsyncHttpxClientWrapper)
+
+    pool = sync_http._transport._pool  # type: ignore[attr-defined]
+    assert pool._http2 is True
+    assert pool._keepalive_expiry == 60.0
+
+
+def test_sync_client_shared_across_instances() -> None:
+    """Test instances with the same settings share one sync client pool."""
+    first = _NimbleClientMixin(api_key="test-key")
+    second = _NimbleClientMixin(api_key="test-key")
+    other = _NimbleClientMixin(api_key="other-key")
+
+    assert first._sync_client is second._sync_client
+    assert first._sync_client is not other._sync_client
+    assert first._async_client is not second._async_client
+
+
+async def test_async_http_client_del_schedules_aclose_on_loop() -> None:
+    """Test collecting the async client closes it on its running loop."""
+    http_client = _AsyncHttpxClientWrapper()
+
+    http_client.__del__()
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert http_client.is_closed
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+@pytest.mark.enable_socket
+def test_async_http_client_del_closes_sockets_without_loop() -> None:
+    """Test collecting the async client after its loop closed frees its sockets."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    http_client = _AsyncHttpxClientWrapper()
+
+    async def _request() -> socket.socket:
+        url = f"http://127.0.0.1:{server.server_port}/"
+        response = await http_client.get(url)
+        assert response.status_code == 200
+        pool = http_client._transport._pool  # type: ignore[attr-defined]
+        stream = pool.connections[0]._connection._network_stream
+        return stream.get_extra_info("socket")._sock
+
+    try:
+        sock = asyncio.run(_request())
+        assert sock.fileno() != -1
+
+        http_client.__del__()
+
+        assert sock.fileno() == -1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _mock_sdk_client(statuses: list[int]) -> tuple[Nimble, list[httpx.Request]]:
+    """Return a sync client answering with ``statuses`` and its request log."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        # Ask for a 1ms backoff so retries do not slow the test down.
+        return httpx.Response(
+            statuses[len(requests) - 1], headers={"retry-after-ms": "1"}, json={}
+        )
+
+    client = _NimbleClientMixin(api_key="test-key")._sync_client
+    assert client is not None
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client.with_options(http_client=http_client), requests
+
+
+@pytest.mark.parametrize("status", [408, 409, 429, 503])
+def test_sdk_retries_retryable_errors(status: int) -> None:
+    """Test the SDK client retries the statuses it deems retryable."""
+    client, requests = _mock_sdk_client([status, status, 200])
+
+    response = client.with_raw_response.search(query="test")
+
+    assert response.http_response.status_code == 200
+    assert len(requests) == 3
+
+
+def test_sdk_does_not_retry_bad_requests() -> None:
+    """Test the SDK client gives up immediately on a 400 response."""
+    client, requests = _mock_sdk_client([400, 200])
+
+    with pytest.raises(BadRequestError):
+        client.with_raw_response.search(query="test")
+
+    assert len(requests) == 1
+
+
+def test_sync_client_pool_shared_across_retry_settings() -> None:
+    """Test different max_retries values still share one connection pool."""
+    default = _NimbleClientMixin(api_key="pool-key")
+    retrying = _NimbleClientMixin(api_key="pool-key", max_retries=4)
+
+    assert default._sync_client is not None
+    assert retrying._sync_client is not None
+    assert retrying._sync_client.max_retries == 4
+    assert default._sync_client.max_retries == 2
+    assert retrying._sync_client._client is default._sync_client._client
+
+
+def test_request_timeout_applied_per_attempt() -> None:
+    """Test request_timeout reaches both SDK clients without a new sync pool."""
+    default = _NimbleClientMixin(api_key="timeout-key")
+    bounded = _NimbleClientMixin(api_key="timeout-key", request_timeout=15.0)
+
+    assert bounded._sync_client is not None
+    assert bounded._async_client is not None
+    assert default._sync_client is not None
+    assert bounded._sync_client.timeout == 15.0
+    assert bounded._async_client.timeout == 15.0
+    assert bounded._sync_client._client is default._sync_client._client
+
+
+def test_shared_sync_clients_closed_at_exit() -> None:
+    """Test the exit hook closes and forgets every shared sync client."""
+    with patch.dict(_SYNC_CLIENTS, clear=True):
+        client = create_sync_client("exit-key", None, 2)
+
+        _close_sync_clients()
+
+        assert client.is_closed()
+        assert _SYNC_CLIENTS == {}
+
+
+def test_shared_sync_clients_bounded() -> None:
+    """Test the registry evicts the least recently used client when full."""
+    with (
+        patch.dict(_SYNC_CLIENTS, clear=True),
+        patch("langchain_nimble._utilities._MAX_SYNC_CLIENTS", 2),
+    ):
+        first = create_sync_client("lru-key-1", None, 2)
+        second = create_sync_client("lru-key-2", None, 2)
+        create_sync_client("lru-key-1", None, 2)
+        create_sync_client("lru-key-3", None, 2)
+
+        assert len(_SYNC_CLIENTS) == 2
+        assert second not in _SYNC_CLIENTS.values()
+        assert create_sync_client("lru-key-1", None, 2) is first
+
+        create_sync_client("lru-key-4", None, 2)
+        create_sync_client("lru-key-5", None, 2)
+        assert first not in _SYNC_CLIENTS.values()
+        # Evicted clients remain usable until their last holder is collected.
+        assert not first.is_closed()
+        pool = weakref.ref(first._client)
+
+        del first
+        gc.collect()
+        assert pool() is None
+
+
+def test_async_client_created_lazily_per_loop() -> None:
+    """Test the async client is built on first use and rebuilt for a new loop."""
+    mixin = _NimbleClientMixin(api_key="test-key")
+    assert mixin._async_client_instance is None
+
+    async def _bound_client() -> AsyncNimble | None:
+        client = mixin._async_client
+        assert client is mixin._async_client
+        return client
+
+    first = asyncio.run(_bound_client())
+    second = asyncio.run(_bound_client())
+
+    assert first is not None
+    assert second is not None
+    assert first is not second
+
+
+def test_http_clients_share_ssl_context() -> None:
+    """Test every HTTP client reuses one SSL context instead of reloading CAs."""
+    sync_http = _SyncHttpxClientWrapper()
+    async_http = _AsyncHttpxClientWrapper()
+
+    sync_ctx = sync_http._transport._pool._ssl_context  # type: ignore[attr-defined]
+    async_ctx = async_http._transport._pool._ssl_context  # type: ignore[attr-defined]
+    assert sync_ctx is async_ctx
+    sync_http.close()